@@ -0,0 +1,51 @@
+import argparse
+import os
+import signal
+import subprocess
+import sys
+
+from scm_data_store import DEFAULT_STORE_DIR, STORE_ENV_VAR, publish
+
+# Multi-worker launcher: publish the datasets once into the shared store,
+# then start one Streamlit worker per port. Put a reverse proxy with sticky
+# sessions in front of the ports (Streamlit sessions live on a websocket
+# bound to one worker).
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run several dashboard workers sharing one data store.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='number of Streamlit workers (default: CPU count)')
+    parser.add_argument('--base-port', type=int, default=8501, help='port of the first worker; the rest follow sequentially')
+    parser.add_argument('--store', default=DEFAULT_STORE_DIR, help='shared store directory (default: %(default)s)')
+    args = parser.parse_args()
+
+    publish(args.store)
+    print(f'Published datasets to {args.store}')
+
+    env = dict(os.environ, **{STORE_ENV_VAR: args.store})
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scm_dashboard_app.py')
+    workers = []
+    for i in range(args.workers):
+        port = args.base_port + i
+        workers.append(subprocess.Popen(
+            [sys.executable, '-m', 'streamlit', 'run', app_path,
+             '--server.port', str(port), '--server.headless', 'true'],
+            env=env,
+        ))
+        print(f'Worker {i + 1} listening on port {port}')
+
+    try:
+        for worker in workers:
+            worker.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in workers:
+            if worker.poll() is None:
+                worker.send_signal(signal.SIGTERM)
+        for worker in workers:
+            worker.wait()
+
+
+if __name__ == '__main__':
+    main()
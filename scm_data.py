@@ -0,0 +1,137 @@
+import pandas as pd
+
+# Dataset definitions shared by the dashboard and the shared data store.
+# Kept free of Streamlit imports so the store publisher can build them
+# without starting an app.
+
+# Order matches the tuple returned by build_datasets()
+DATASET_NAMES = (
+    'competitors',
+    'market_gaps',
+    'ai_features',
+    'target_segments',
+    'revenue_streams',
+    'market_growth',
+    'strategic_insights',
+)
+
+
+def build_datasets():
+    # Competitor data
+    competitors = pd.DataFrame([
+        {'vendor': 'Kinaxis', 'segment': 'Large Enterprise', 'coverage': 9, 'ai': 9, 'cost': 2, 'smeAccess': 1, 'opportunity': 8},
+        {'vendor': 'SAP B1/SCM', 'segment': 'Mid + Large', 'coverage': 10, 'ai': 9, 'cost': 2, 'smeAccess': 3, 'opportunity': 7},
+        {'vendor': 'Infor GT Nexus', 'segment': 'Enterprise', 'coverage': 8, 'ai': 7, 'cost': 3, 'smeAccess': 2, 'opportunity': 8},
+        {'vendor': 'Manhattan', 'segment': 'Enterprise Retail', 'coverage': 8, 'ai': 8, 'cost': 2, 'smeAccess': 2, 'opportunity': 7},
+        {'vendor': 'Blue Yonder', 'segment': 'Enterprise', 'coverage': 9, 'ai': 9, 'cost': 2, 'smeAccess': 1, 'opportunity': 8},
+        {'vendor': 'o9 Solutions', 'segment': 'Enterprise', 'coverage': 8, 'ai': 9, 'cost': 2, 'smeAccess': 1, 'opportunity': 9},
+        {'vendor': 'FourKites', 'segment': 'Enterprise', 'coverage': 6, 'ai': 7, 'cost': 5, 'smeAccess': 4, 'opportunity': 6},
+        {'vendor': 'Project44', 'segment': 'Enterprise', 'coverage': 6, 'ai': 7, 'cost': 5, 'smeAccess': 4, 'opportunity': 6},
+        {'vendor': 'Bizongo', 'segment': 'India SME/Mid', 'coverage': 5, 'ai': 5, 'cost': 7, 'smeAccess': 8, 'opportunity': 5}
+    ])
+    
+    # Market gaps
+    market_gaps = pd.DataFrame([
+        {'gap': 'SME fragmentation', 'priority': 'Critical', 'impact': 9, 'ease': 8, 'value': 'Removes tool sprawl'},
+        {'gap': 'Enterprise complexity', 'priority': 'High', 'impact': 8, 'ease': 7, 'value': 'Faster adoption'},
+        {'gap': 'Weak India localization', 'priority': 'Critical', 'impact': 10, 'ease': 9, 'value': 'Regulatory fit'},
+        {'gap': 'Excel planning', 'priority': 'High', 'impact': 8, 'ease': 8, 'value': 'Better decisions'},
+        {'gap': 'Manual vendor mgmt', 'priority': 'Medium', 'impact': 7, 'ease': 7, 'value': 'Performance visibility'},
+        {'gap': 'No cross-module sync', 'priority': 'High', 'impact': 8, 'ease': 6, 'value': 'Dept alignment'},
+        {'gap': 'Static dashboards', 'priority': 'Medium', 'impact': 7, 'ease': 8, 'value': 'Real-time ops view'},
+        {'gap': 'High license cost', 'priority': 'Critical', 'impact': 9, 'ease': 9, 'value': 'Lower entry barrier'},
+        {'gap': 'No SME AI', 'priority': 'Critical', 'impact': 10, 'ease': 7, 'value': 'Decision intelligence'}
+    ])
+    market_gaps['score'] = (market_gaps['impact'] * 0.6 + market_gaps['ease'] * 0.4).round(1)
+    
+    # AI Features
+    ai_features = pd.DataFrame([
+        {'feature': 'Inventory AI Copilot', 'smeDiff': 9, 'enterpriseHas': 3, 'implementation': 7, 'roi': 9},
+        {'feature': 'Demand Forecast AI', 'smeDiff': 7, 'enterpriseHas': 8, 'implementation': 8, 'roi': 8},
+        {'feature': 'AI Reorder Engine', 'smeDiff': 8, 'enterpriseHas': 5, 'implementation': 7, 'roi': 9},
+        {'feature': 'Supplier AI Scoring', 'smeDiff': 8, 'enterpriseHas': 4, 'implementation': 6, 'roi': 7},
+        {'feature': 'Conversational Copilot', 'smeDiff': 9, 'enterpriseHas': 2, 'implementation': 6, 'roi': 8},
+        {'feature': 'Anomaly Detection', 'smeDiff': 7, 'enterpriseHas': 6, 'implementation': 8, 'roi': 8},
+        {'feature': 'Scenario Simulation', 'smeDiff': 8, 'enterpriseHas': 7, 'implementation': 5, 'roi': 7},
+        {'feature': 'Document AI', 'smeDiff': 9, 'enterpriseHas': 4, 'implementation': 9, 'roi': 10},
+        {'feature': 'Redistribution AI', 'smeDiff': 9, 'enterpriseHas': 3, 'implementation': 6, 'roi': 8}
+    ])
+    
+    # Target segments
+    target_segments = pd.DataFrame([
+        {
+            'name': 'Industrial SMEs (Peenya)',
+            'priority': 10,
+            'marketSize': 850,
+            'avgDeal': 15000,
+            'conversionRate': 35,
+            'painPoints': 'Stockouts/overstock, Manual PO/GRN, Invoice mismatches',
+            'modules': 'Inventory, PO/GRN, WMS-lite, Transport, Document AI'
+        },
+        {
+            'name': 'Distributors/Wholesalers',
+            'priority': 9,
+            'marketSize': 620,
+            'avgDeal': 18000,
+            'conversionRate': 30,
+            'painPoints': 'Order-to-cash gaps, Delivery failures, Excel planning',
+            'modules': 'Order Mgmt, Inventory, Route/Dispatch, Control Tower, CRM'
+        },
+        {
+            'name': 'D2C/E-commerce',
+            'priority': 8,
+            'marketSize': 480,
+            'avgDeal': 12000,
+            'conversionRate': 40,
+            'painPoints': 'Forecasting, Inventory sync, Shipment SLA tracking',
+            'modules': 'Inventory, Sales channels, Forecasting, Control Tower'
+        },
+        {
+            'name': '3PLs/Transport',
+            'priority': 7,
+            'marketSize': 340,
+            'avgDeal': 20000,
+            'conversionRate': 25,
+            'painPoints': 'Shipment tracking, Delay prediction, Billing disputes',
+            'modules': 'Transport, Tracking, Control Tower, Invoice/Claims'
+        }
+    ])
+    
+    # Revenue streams
+    revenue_streams = pd.DataFrame([
+        {'stream': 'Core subscription', 'segment': 'SME + Mid', 'recurring': 100, 'margin': 85, 'scalability': 9},
+        {'stream': 'Seat-based', 'segment': 'Mid-market teams', 'recurring': 100, 'margin': 88, 'scalability': 8},
+        {'stream': 'Usage-based AI', 'segment': 'SMEs wanting ROI', 'recurring': 80, 'margin': 75, 'scalability': 10},
+        {'stream': 'Transaction-based logistics', 'segment': 'Distributors + fleets', 'recurring': 70, 'margin': 65, 'scalability': 9},
+        {'stream': 'Implementation', 'segment': 'Mid-market', 'recurring': 0, 'margin': 40, 'scalability': 5},
+        {'stream': 'Integration marketplace', 'segment': 'All', 'recurring': 90, 'margin': 95, 'scalability': 10},
+        {'stream': 'Premium support/SLA', 'segment': 'Mid-market', 'recurring': 100, 'margin': 90, 'scalability': 7}
+    ])
+    revenue_streams['score'] = (revenue_streams['recurring'] * 0.3 + revenue_streams['margin'] * 0.3 + revenue_streams['scalability'] * 10 * 0.4).round(1)
+    
+    # Market growth
+    market_growth = pd.DataFrame([
+        {'year': 2024, 'logistics': 215, 'warehouse': 8.2, 'wms': 1.4},
+        {'year': 2025, 'logistics': 245, 'warehouse': 9.1, 'wms': 1.6},
+        {'year': 2026, 'logistics': 280, 'warehouse': 10.2, 'wms': 1.9},
+        {'year': 2027, 'logistics': 320, 'warehouse': 11.5, 'wms': 2.2},
+        {'year': 2028, 'logistics': 365, 'warehouse': 13.0, 'wms': 2.6},
+        {'year': 2029, 'logistics': 415, 'warehouse': 14.8, 'wms': 3.1},
+        {'year': 2030, 'logistics': 475, 'warehouse': 16.9, 'wms': 3.7}
+    ])
+    
+    # Strategic insights
+    strategic_insights = [
+        {'category': 'Positioning', 'insight': 'Stay SME-first and avoid enterprise feature overload', 'status': 'critical', 'impact': 'high'},
+        {'category': 'Moat', 'insight': 'Embedded AI + Workflow + Localization combined', 'status': 'strength', 'impact': 'high'},
+        {'category': 'Wedge Market', 'insight': 'India compliance + GST + e-invoice integration', 'status': 'opportunity', 'impact': 'high'},
+        {'category': 'Narrative', 'insight': 'Control Tower + Copilot fusion central in pitch', 'status': 'strength', 'impact': 'medium'},
+        {'category': 'Competition', 'insight': 'Compete on speed + usability + cost, NOT features', 'status': 'critical', 'impact': 'high'},
+        {'category': 'Pricing', 'insight': 'Modular pricing aligns with SME buying behavior', 'status': 'strength', 'impact': 'high'},
+        {'category': 'Quick Win', 'insight': 'Document AI + auto data ingestion high ROI', 'status': 'opportunity', 'impact': 'high'},
+        {'category': 'Differentiator', 'insight': 'Conversational SCM layer strong demo tool', 'status': 'strength', 'impact': 'medium'},
+        {'category': 'Risk', 'insight': 'Scope creep - ship core execution first, AI second', 'status': 'warning', 'impact': 'high'},
+        {'category': 'GTM', 'insight': 'Target multi-warehouse SMEs and distributors first', 'status': 'opportunity', 'impact': 'high'}
+    ]
+    
+    return competitors, market_gaps, ai_features, target_segments, revenue_streams, market_growth, strategic_insights
@@ -0,0 +1,81 @@
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+
+from scm_data import DATASET_NAMES, build_datasets
+
+# Shared data store for multi-worker deployments.
+#
+# The publisher builds every dataset once (including the derived score
+# columns) and writes each one as an Arrow IPC file. Workers memory-map
+# those files, so all app processes on the box read the same page-cache
+# pages instead of holding their own copy. Pointing the store at /dev/shm
+# keeps it in RAM.
+
+STORE_ENV_VAR = 'SCM_DATA_STORE'
+DEFAULT_STORE_DIR = '/dev/shm/scm-dashboard' if os.path.isdir('/dev/shm') else os.path.join(tempfile.gettempdir(), 'scm-dashboard')
+
+# strategic_insights is a list of dicts in the app; stored as a table
+RECORD_DATASETS = ('strategic_insights',)
+
+
+def store_dir():
+    """Return the configured store directory, or None when running standalone."""
+    return os.environ.get(STORE_ENV_VAR) or None
+
+
+def _dataset_path(directory, name):
+    return os.path.join(directory, f'{name}.arrow')
+
+
+def publish(directory=DEFAULT_STORE_DIR):
+    """Build all datasets and write them to the store directory."""
+    os.makedirs(directory, exist_ok=True)
+    for name, data in zip(DATASET_NAMES, build_datasets()):
+        if name in RECORD_DATASETS:
+            data = pd.DataFrame(data)
+        table = pa.Table.from_pandas(data, preserve_index=False)
+
+        # Write to a temp file and rename so attached readers never see a partial file
+        path = _dataset_path(directory, name)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return directory
+
+
+def attach(directory):
+    """Memory-map the published datasets and return them in build_datasets() order.
+
+    Numeric columns are converted without copying where pyarrow allows it;
+    string columns still become Python objects in each worker.
+    """
+    datasets = []
+    for name in DATASET_NAMES:
+        source = pa.memory_map(_dataset_path(directory, name), 'r')
+        table = pa.ipc.open_file(source).read_all()
+        df = table.to_pandas(split_blocks=True)
+        if name in RECORD_DATASETS:
+            datasets.append(df.to_dict('records'))
+        else:
+            datasets.append(df)
+    return tuple(datasets)
+
+
+def is_published(directory):
+    return all(os.path.exists(_dataset_path(directory, name)) for name in DATASET_NAMES)
+
+
+if __name__ == '__main__':
+    import sys
+
+    target = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_STORE_DIR
+    print(f'Published datasets to {publish(target)}')